@@ -1,12 +1,17 @@
 from pathlib import Path
 
-content = """import path from 'node:path';
+content = """import fs from 'node:fs';
+import { mkdir, open, rm, writeFile } from 'node:fs/promises';
+import path from 'node:path';
 import { spawn } from 'node:child_process';
-import fs from 'fs-extra';
 import chalk from 'chalk';
-import inquirer from 'inquirer';
 import { promptForMissingOptions, PromptOptions } from '../prompts/prompts';
-import { FrontendFrameworkKey, Language, frontendFrameworkCatalogMap } from '../generators/types';
+import {
+  FrontendFrameworkDefinition,
+  FrontendFrameworkKey,
+  Language,
+  frontendFrameworkCatalogMap,
+} from '../generators/types';
 import { getGeneratorForLanguage } from '../generators/registry';
 
 export interface CreateCommandOptions extends PromptOptions {
@@ -15,91 +20,334 @@ export interface CreateCommandOptions extends PromptOptions {
 
 interface FrontendScaffoldResult {
   framework: Exclude<FrontendFrameworkKey, 'none'>;
+  definition: FrontendFrameworkDefinition;
   directory: string;
 }
 
-function ensureSafeProjectDirectory(targetDir: string) {
-  if (!fs.existsSync(targetDir)) {
-    return;
-  }
+// Files written into the generated front; __PROJECT_NAME__ is replaced with the project name as a JS string literal.
+const PROJECT_NAME_PLACEHOLDER = '__PROJECT_NAME__';
 
-  const stats = fs.statSync(targetDir);
-  if (!stats.isDirectory()) {
-    throw new Error(`${targetDir} existe déjé et n'est pas un dossier.`);
+const REACT_API_TS = `const API_BASE_URL = (import.meta.env.VITE_API_URL ?? 'http://localhost:3333').replace(/\\\\/$/, '');
+
+export interface StatusSnapshot {
+  status?: string;
+  features?: Array<{ key?: string; name?: string; summary?: string }>;
+  dependencies?: Array<{ name?: string; status?: string; details?: string }>;
+  dataProviders?: Array<{ key?: string; status?: string; details?: string }>;
+}
+
+export async function fetchStatus(signal?: AbortSignal): Promise<StatusSnapshot> {
+  const response = await fetch(API_BASE_URL + '/status', { signal });
+
+  if (!response.ok) {
+    throw new Error("Impossible de contacter l'API (statut " + response.status + ")");
   }
 
-  const files = fs.readdirSync(targetDir);
-  if (files.length > 0) {
-    throw new Error(`Le dossier ${targetDir} n'est pas vide. Choisissez un dossier vide ou un nouveau nom.`);
+  return (await response.json()) as StatusSnapshot;
+}
+`;
+
+const REACT_APP_TSX = `import { useEffect, useState } from 'react';
+import './App.css';
+import { fetchStatus, type StatusSnapshot } from './lib/api';
+
+export default function App() {
+  const [status, setStatus] = useState<StatusSnapshot | null>(null);
+  const [error, setError] = useState<string | null>(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    fetchStatus()
+      .then((snapshot) => setStatus(snapshot))
+      .catch((err) => setError((err as Error).message))
+      .finally(() => setLoading(false));
+  }, []);
+
+  return (
+    <main className="layout">
+      <h1>{__PROJECT_NAME__} – Console API</h1>
+      <p>Cette interface interroge <code>GET /status</code> de l'API générée.</p>
+      <div className="panel">
+        {loading ? <p>Chargement…</p> : null}
+        {error ? <p className="error">{error}</p> : null}
+        {!loading && !error ? (
+          <pre>{JSON.stringify(status, null, 2)}</pre>
+        ) : null}
+      </div>
+    </main>
+  );
+}
+`;
+
+const REACT_APP_CSS = `.layout {
+  min-height: 100vh;
+  padding: 2.5rem clamp(1.5rem, 4vw, 4rem);
+  background: #0f172a;
+  color: #e2e8f0;
+  display: flex;
+  flex-direction: column;
+  gap: 1.5rem;
+  font-family: 'Inter', system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+}
+
+.panel {
+  background: rgba(15, 23, 42, 0.75);
+  border: 1px solid rgba(148, 163, 184, 0.25);
+  border-radius: 1rem;
+  padding: 1.25rem;
+  overflow: auto;
+}
+
+.panel pre {
+  margin: 0;
+  font-size: 0.9rem;
+}
+
+.error {
+  color: #f87171;
+}
+
+code {
+  background: rgba(148, 163, 184, 0.25);
+  padding: 0.1rem 0.4rem;
+  border-radius: 0.4rem;
+}
+`;
+
+const NEXT_API_TS = `const API_BASE_URL = (process.env.NEXT_PUBLIC_API_URL ?? 'http://localhost:3333').replace(/\\\\/$/, '');
+
+export interface StatusSnapshot {
+  status?: string;
+  features?: Array<{ key?: string; name?: string; summary?: string }>;
+  dependencies?: Array<{ name?: string; status?: string; details?: string }>;
+  dataProviders?: Array<{ key?: string; status?: string; details?: string }>;
+}
+
+export async function fetchStatus(): Promise<StatusSnapshot> {
+  const response = await fetch(API_BASE_URL + '/status', { cache: 'no-store' });
+
+  if (!response.ok) {
+    throw new Error("Impossible de contacter l'API (statut " + response.status + ")");
   }
+
+  return (await response.json()) as StatusSnapshot;
 }
+`;
 
-function getPackageManagerCommand(
-  packageManager: 'npm' | 'pnpm' | 'yarn',
-  command: 'install' | 'dev' | 'apiStatus' | 'test'
-) {
-  if (packageManager === 'npm') {
-    if (command === 'install') {
-      return 'npm install';
-    }
-    if (command === 'dev') {
-      return 'npm run dev';
+const NEXT_LAYOUT_TSX = `import type { Metadata } from 'next';
+import './globals.css';
+
+export const metadata: Metadata = {
+  title: __PROJECT_NAME__ + ' – Console API',
+  description: "Interface front générée avec create-template-api pour consommer l'API.",
+};
+
+export default function RootLayout({ children }: { children: React.ReactNode }) {
+  return (
+    <html lang="fr">
+      <body>{children}</body>
+    </html>
+  );
+}
+`;
+
+const NEXT_PAGE_TSX = `import { fetchStatus } from '../lib/api';
+
+export default async function Home() {
+  const status = await fetchStatus();
+
+  return (
+    <main className="layout">
+      <h1>{__PROJECT_NAME__} – Console API</h1>
+      <p>Cette page interroge <code>GET /status</code> du backend côté serveur.</p>
+      <pre>{JSON.stringify(status, null, 2)}</pre>
+    </main>
+  );
+}
+`;
+
+const NEXT_GLOBALS_CSS = `:root {
+  color-scheme: dark;
+  background-color: #0f172a;
+  color: #e2e8f0;
+  font-family: 'Inter', system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+}
+
+body {
+  margin: 0;
+}
+
+.layout {
+  min-height: 100vh;
+  padding: 2.5rem clamp(1.5rem, 4vw, 4rem);
+  display: flex;
+  flex-direction: column;
+  gap: 1.5rem;
+}
+
+.layout pre {
+  margin: 0;
+  background: rgba(15, 23, 42, 0.75);
+  border: 1px solid rgba(148, 163, 184, 0.25);
+  border-radius: 1rem;
+  padding: 1.25rem;
+  overflow: auto;
+}
+
+.layout code {
+  background: rgba(148, 163, 184, 0.25);
+  padding: 0.1rem 0.4rem;
+  border-radius: 0.4rem;
+}
+`;
+
+// Invariant files are encoded once instead of on every write.
+const REACT_ENV_BUFFER = Buffer.from('VITE_API_URL=http://localhost:3333\\n', 'utf8');
+const REACT_API_TS_BUFFER = Buffer.from(REACT_API_TS, 'utf8');
+const NEXT_ENV_BUFFER = Buffer.from('NEXT_PUBLIC_API_URL=http://localhost:3333\\n', 'utf8');
+const NEXT_API_TS_BUFFER = Buffer.from(NEXT_API_TS, 'utf8');
+const REACT_APP_CSS_BUFFER = Buffer.from(REACT_APP_CSS, 'utf8');
+const NEXT_GLOBALS_CSS_BUFFER = Buffer.from(NEXT_GLOBALS_CSS, 'utf8');
+
+function ensureSafeProjectDirectory(targetDir: string) {
+  let files: string[];
+  try {
+    files = fs.readdirSync(targetDir);
+  } catch (error) {
+    const code = (error as NodeJS.ErrnoException).code;
+    if (code === 'ENOENT') {
+      return;
     }
-    if (command === 'test') {
-      return 'npm test';
+    if (code === 'ENOTDIR') {
+      throw new Error(`${targetDir} existe déjà et n\\'est pas un dossier.`);
     }
-    return 'npm run api -- --status';
+    throw error;
   }
 
-  if (packageManager === 'pnpm') {
-    if (command === 'install') {
-      return 'pnpm install';
-    }
-    if (command === 'dev') {
-      return 'pnpm dev';
-    }
-    if (command === 'test') {
-      return 'pnpm test';
-    }
-    return 'pnpm api --status';
+  if (files.length > 0) {
+    throw new Error(`Le dossier ${targetDir} n\\'est pas vide. Choisissez un dossier vide ou un nouveau nom.`);
   }
+}
+
+// Pinned scaffolder versions. create-next-app writes its own version as the project's `next` dependency,
+// so these must be bumped whenever a security release ships for Vite or Next.js.
+const CREATE_VITE_VERSION = '5.5.3';
+const CREATE_NEXT_APP_VERSION = '16.0.10';
+
+type PackageManager = 'npm' | 'pnpm' | 'yarn';
+type PackageManagerCommandKey = 'install' | 'dev' | 'apiStatus' | 'test';
+
+const PM_COMMANDS = {
+  npm: {
+    install: 'npm install',
+    dev: 'npm run dev',
+    test: 'npm test',
+    apiStatus: 'npm run api -- --status',
+  },
+  pnpm: {
+    install: 'pnpm install',
+    dev: 'pnpm dev',
+    test: 'pnpm test',
+    apiStatus: 'pnpm api --status',
+  },
+  yarn: {
+    install: 'yarn install',
+    dev: 'yarn dev',
+    test: 'yarn test',
+    apiStatus: 'yarn api --status',
+  },
+} as const satisfies Record<PackageManager, Record<PackageManagerCommandKey, string>>;
+
+const PM_RUN = {
+  npm: (script) => `npm run ${script}`,
+  pnpm: (script) => `pnpm ${script}`,
+  yarn: (script) => `yarn ${script}`,
+} satisfies Record<PackageManager, (script: string) => string>;
+
+// npm and pnpm chain install + test in a single process; yarn has no equivalent.
+const PM_INSTALL_TEST = {
+  npm: 'npm install-test',
+  pnpm: 'pnpm install-test',
+  yarn: undefined,
+} as const satisfies Record<PackageManager, string | undefined>;
+
+function getPackageManagerCommand(packageManager: PackageManager, command: PackageManagerCommandKey) {
+  return PM_COMMANDS[packageManager][command];
+}
 
-  if (command === 'install') {
-    return 'yarn install';
+function getPackageManagerArgv(packageManager: PackageManager, command: PackageManagerCommandKey): string[] {
+  return PM_COMMANDS[packageManager][command].split(' ');
+}
+
+function getPackageManagerRunCommand(packageManager: PackageManager, script: string) {
+  return PM_RUN[packageManager](script);
+}
+
+// POSIX paths are already in display form, so the conversion is only done on Windows.
+const toPosixPath: (value: string) => string =
+  path.sep === '/' ? (value) => value : (value) => value.replaceAll(path.sep, '/');
+
+const resolvedExecutables = new Map<string, string>();
+
+function resolveExecutable(command: string): string {
+  // Windows keeps resolving through the shell (see runShellCommand).
+  if (process.platform === 'win32' || path.isAbsolute(command)) {
+    return command;
   }
-  if (command === 'dev') {
-    return 'yarn dev';
+
+  const cached = resolvedExecutables.get(command);
+  if (cached) {
+    return cached;
   }
-  if (command === 'test') {
-    return 'yarn test';
+
+  for (const directory of (process.env.PATH ?? '').split(path.delimiter)) {
+    // Relative entries depend on the child's cwd, so they cannot be resolved and cached here.
+    if (!directory || !path.isAbsolute(directory)) {
+      continue;
+    }
+
+    const candidate = path.join(directory, command);
+    if (!fs.statSync(candidate, { throwIfNoEntry: false })?.isFile()) {
+      continue;
+    }
+
+    try {
+      fs.accessSync(candidate, fs.constants.X_OK);
+      resolvedExecutables.set(command, candidate);
+      return candidate;
+    } catch {
+      // Present but not executable, keep looking like execvp does.
+    }
   }
-  return 'yarn api --status';
+
+  return command;
 }
 
-function getPackageManagerRunCommand(packageManager: 'npm' | 'pnpm' | 'yarn', script: string) {
-  if (packageManager === 'npm') {
-    return `npm run ${script}`;
-  }
-  if (packageManager === 'pnpm') {
-    return `pnpm ${script}`;
+async function writeNewFile(filePath: string, content: Buffer) {
+  const handle = await open(filePath, 'wx');
+  try {
+    await handle.write(content);
+  } finally {
+    await handle.close();
   }
-  return `yarn ${script}`;
 }
 
-function toPosixPath(value: string): string {
-  return value.split(path.sep).join('/');
+interface RunShellCommandOptions {
+  quiet?: boolean;
 }
 
-function escapeBackticks(value: string): string {
-  return value.replace(/`/g, '\\`');
-}
+async function runShellCommand(argv: string[], cwd: string, options: RunShellCommandOptions = {}) {
+  const [file, ...args] = argv;
+  const command = argv.join(' ');
 
-async function runShellCommand(command: string, cwd: string) {
   return new Promise<void>((resolve, reject) => {
-    const child = spawn(command, {
+    // Windows package managers are .cmd shims, which Node only launches through a shell.
+    const child = spawn(resolveExecutable(file), args, {
       cwd,
-      shell: true,
-      stdio: 'inherit',
+      shell: process.platform === 'win32',
+      // Quiet runs drop stdout (progress bars, install logs) but keep stderr for failures.
+      stdio: options.quiet ? ['ignore', 'ignore', 'inherit'] : 'inherit',
+      env: options.quiet ? { ...process.env, NPM_CONFIG_PROGRESS: 'false', FORCE_COLOR: '0' } : process.env,
     });
 
     child.on('error', (error) => reject(error));
@@ -107,15 +355,38 @@ async function runShellCommand(command: string, cwd: string) {
       if (code === 0) {
         resolve();
       } else {
-        reject(new Error(`La commande "${command}" s'est terminée avec le code ${code}.`));
+        reject(new Error(`La commande "${command}" s\\'est terminée avec le code ${code}.`));
       }
     });
   });
 }
 
+async function installAndTestApi(
+  packageManager: PackageManager,
+  targetDirectory: string,
+  options: RunShellCommandOptions = {}
+) {
+  const installTestCommand = PM_INSTALL_TEST[packageManager];
+
+  if (installTestCommand) {
+    console.log('\\n' + chalk.cyan(`Installation des dépendances et exécution des tests (${installTestCommand})...`));
+    await runShellCommand(installTestCommand.split(' '), targetDirectory, options);
+    return;
+  }
+
+  const installCommand = getPackageManagerCommand(packageManager, 'install');
+  const testCommand = getPackageManagerCommand(packageManager, 'test');
+
+  console.log('\\n' + chalk.cyan(`Installation des dépendances (${installCommand})...`));
+  await runShellCommand(getPackageManagerArgv(packageManager, 'install'), targetDirectory, options);
+
+  console.log('\\n' + chalk.cyan(`Exécution des tests (${testCommand})...`));
+  await runShellCommand(getPackageManagerArgv(packageManager, 'test'), targetDirectory, options);
+}
+
 async function scaffoldFrontend(options: {
   framework: FrontendFrameworkKey;
-  packageManager: 'npm' | 'pnpm' | 'yarn';
+  packageManager: PackageManager;
   targetDirectory: string;
   projectName: string;
   dryRun: boolean;
@@ -132,291 +403,142 @@ async function scaffoldFrontend(options: {
   }
 
   const frontendDir = path.join(targetDirectory, definition.appDirectory);
-  const relativeForDisplay = path.relative(process.cwd(), frontendDir) || definition.appDirectory;
+  const relativeForDisplay = toPosixPath(path.relative(process.cwd(), frontendDir) || definition.appDirectory);
 
   if (dryRun) {
     console.log(
       chalk.yellow(
-        `[dry-run] Front ${definition.name} généré dans ${toPosixPath(relativeForDisplay)} (aucune commande exécutée).`
+        `[dry-run] Front ${definition.name} généré dans ${relativeForDisplay} (aucune commande exécutée).`
       )
     );
-    return { framework, directory: frontendDir };
+    return { framework, definition, directory: frontendDir };
   }
 
-  if (await fs.pathExists(frontendDir)) {
+  if (fs.statSync(frontendDir, { throwIfNoEntry: false })) {
     throw new Error(
-      `Le dossier ${toPosixPath(relativeForDisplay)} existe déjé. Supprimez-le ou choisissez un autre emplacement pour le front.`
+      `Le dossier ${relativeForDisplay} existe déjà. Supprimez-le ou choisissez un autre emplacement pour le front.`
     );
   }
 
-  await fs.ensureDir(path.dirname(frontendDir));
+  await mkdir(path.dirname(frontendDir), { recursive: true });
 
-  console.log('\n' + chalk.cyan(`[Front] Génération ${definition.name}...`));
+  console.log('\\n' + chalk.cyan(`[Front] Génération ${definition.name}...`));
 
   if (framework === 'react-vite') {
-    await scaffoldReactVite(frontendDir, targetDirectory, packageManager, projectName, definition.envFileName);
+    await scaffoldReactVite(definition, frontendDir, targetDirectory, projectName);
   } else if (framework === 'nextjs') {
-    await scaffoldNextJs(frontendDir, targetDirectory, packageManager, projectName, definition.envFileName);
+    await scaffoldNextJs(definition, frontendDir, targetDirectory, packageManager, projectName);
   } else {
     throw new Error(`Framework front non supporté: ${framework}`);
   }
 
-  console.log(chalk.green(`[OK] Front ${definition.name} prét dans ${toPosixPath(relativeForDisplay)}.`));
+  console.log(
+    chalk.green(`[OK] Front ${definition.name} généré dans ${relativeForDisplay} (dépendances non installées).`)
+  );
 
-  return { framework, directory: frontendDir };
+  return { framework, definition, directory: frontendDir };
 }
-
 async function scaffoldReactVite(
+  definition: FrontendFrameworkDefinition,
   frontendDir: string,
   targetDirectory: string,
-  packageManager: 'npm' | 'pnpm' | 'yarn',
-  projectName: string,
-  envFileName: string
+  projectName: string
 ) {
   const relativeDir = toPosixPath(path.relative(targetDirectory, frontendDir) || '.');
-  const scaffoldCommand = `npx --yes create-vite@latest ${relativeDir} -- --template react-ts`;
+  const scaffoldArgv = ['npx', '--yes', `create-vite@${CREATE_VITE_VERSION}`, relativeDir, '--', '--template', 'react-ts'];
 
-  console.log(chalk.gray(`> ${scaffoldCommand}`));
-  await runShellCommand(scaffoldCommand, targetDirectory);
+  console.log(chalk.gray(`> ${scaffoldArgv.join(' ')}`));
+  await runShellCommand(scaffoldArgv, targetDirectory);
 
-  console.log(chalk.gray(`> ${getPackageManagerCommand(packageManager, 'install')}`));
-  await runShellCommand(getPackageManagerCommand(packageManager, 'install'), frontendDir);
-
-  await customizeReactVite(frontendDir, projectName, envFileName);
+  await customizeReactVite(frontendDir, projectName, definition.envFileName);
 }
 
 async function customizeReactVite(frontendDir: string, projectName: string, envFileName: string) {
-  const safeProjectName = escapeBackticks(projectName);
-
-  await fs.ensureDir(path.join(frontendDir, 'src', 'lib'));
-  await fs.remove(path.join(frontendDir, 'src', 'assets')).catch(() => undefined);
-
-  await fs.writeFile(path.join(frontendDir, envFileName), 'VITE_API_URL=http://localhost:3333\n');
-
-  const apiLines = [
-    "const API_BASE_URL = (import.meta.env.VITE_API_URL ?? 'http://localhost:3333').replace(/\\/$/, '');",
-    '',
-    'export interface StatusSnapshot {',
-    "  status?: string;",
-    "  features?: Array<{ key?: string; name?: string; summary?: string }>;",
-    "  dependencies?: Array<{ name?: string; status?: string; details?: string }>;",
-    "  dataProviders?: Array<{ key?: string; status?: string; details?: string }>;",
-    '}',
-    '',
-    'export async function fetchStatus(signal?: AbortSignal): Promise<StatusSnapshot> {',
-    "  const response = await fetch(API_BASE_URL + '/status', { signal });",
-    '',
-    '  if (!response.ok) {',
-    "    throw new Error(\"Impossible de contacter l'API (statut \" + response.status + \")\");",
-    '  }',
-    '',
-    '  return (await response.json()) as StatusSnapshot;',
-    '}',
-  ];
-  await fs.writeFile(path.join(frontendDir, 'src', 'lib', 'api.ts'), apiLines.join('\n') + '\n');
-
-  const appLines = [
-    "import { useEffect, useState } from 'react';",
-    "import './App.css';",
-    "import { fetchStatus, type StatusSnapshot } from './lib/api';",
-    '',
-    'export default function App() {',
-    '  const [status, setStatus] = useState<StatusSnapshot | null>(null);',
-    '  const [error, setError] = useState<string | null>(null);',
-    '  const [loading, setLoading] = useState(true);',
-    '',
-    '  useEffect(() => {',
-    '    fetchStatus()',
-    '      .then((snapshot) => setStatus(snapshot))',
-    '      .catch((err) => setError((err as Error).message))',
-    '      .finally(() => setLoading(false));',
-    '  }, []);',
-    '',
-    '  return (',
-    '    <main className="layout">',
-    f"      <h1>{safeProjectName} é Console API</h1>",
-    "      <p>Cette interface interroge <code>GET /status</code> de l'API générée.</p>",
-    '      <div className="panel">',
-    '        {loading ? <p>Chargementé</p> : null}',
-    '        {error ? <p className="error">{error}</p> : null}',
-    '        {!loading && !error ? (',
-    '          <pre>{JSON.stringify(status, null, 2)}</pre>',
-    '        ) : null}',
-    '      </div>',
-    '    </main>',
-    '  );',
-    '}',
-  ];
-  await fs.writeFile(path.join(frontendDir, 'src', 'App.tsx'), appLines.join('\n') + '\n');
-
-  const cssLines = [
-    '.layout {',
-    '  min-height: 100vh;',
-    '  padding: 2.5rem clamp(1.5rem, 4vw, 4rem);',
-    '  background: #0f172a;',
-    '  color: #e2e8f0;',
-    '  display: flex;',
-    '  flex-direction: column;',
-    '  gap: 1.5rem;',
-    "  font-family: 'Inter', system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;",
-    '}',
-    '',
-    '.panel {',
-    '  background: rgba(15, 23, 42, 0.75);',
-    '  border: 1px solid rgba(148, 163, 184, 0.25);',
-    '  border-radius: 1rem;',
-    '  padding: 1.25rem;',
-    '  overflow: auto;',
-    '}',
-    '',
-    '.panel pre {',
-    '  margin: 0;',
-    '  font-size: 0.9rem;',
-    '}',
-    '',
-    '.error {',
-    '  color: #f87171;',
-    '}',
-    '',
-    'code {',
-    '  background: rgba(148, 163, 184, 0.25);',
-    '  padding: 0.1rem 0.4rem;',
-    '  border-radius: 0.4rem;',
-    '}',
-  ];
-  await fs.writeFile(path.join(frontendDir, 'src', 'App.css'), cssLines.join('\n') + '\n');
+  const projectNameLiteral = JSON.stringify(projectName);
+  const libDir = path.join(frontendDir, 'src', 'lib');
+
+  await Promise.all([
+    mkdir(libDir, { recursive: true }).then(() => writeFile(path.join(libDir, 'api.ts'), REACT_API_TS_BUFFER)),
+    rm(path.join(frontendDir, 'src', 'assets'), { recursive: true, force: true }),
+    writeNewFile(path.join(frontendDir, envFileName), REACT_ENV_BUFFER),
+    writeFile(
+      path.join(frontendDir, 'src', 'App.tsx'),
+      REACT_APP_TSX.replaceAll(PROJECT_NAME_PLACEHOLDER, () => projectNameLiteral)
+    ),
+    writeFile(path.join(frontendDir, 'src', 'App.css'), REACT_APP_CSS_BUFFER),
+  ]);
 }
-
 async function scaffoldNextJs(
+  definition: FrontendFrameworkDefinition,
   frontendDir: string,
   targetDirectory: string,
-  packageManager: 'npm' | 'pnpm' | 'yarn',
-  projectName: string,
-  envFileName: string
+  packageManager: PackageManager,
+  projectName: string
 ) {
   const relativeDir = toPosixPath(path.relative(targetDirectory, frontendDir) || '.');
   const packageFlag = packageManager === 'pnpm' ? '--use-pnpm' : packageManager === 'yarn' ? '--use-yarn' : '--use-npm';
-  const scaffoldCommand = `npx --yes create-next-app@latest ${relativeDir} --ts --app --src-dir --eslint --no-tailwind --import-alias "@/*" ${packageFlag} --skip-install --no-git`;
-
-  console.log(chalk.gray(`> ${scaffoldCommand}`));
-  await runShellCommand(scaffoldCommand, targetDirectory);
+  const scaffoldArgv = [
+    'npx',
+    '--yes',
+    `create-next-app@${CREATE_NEXT_APP_VERSION}`,
+    relativeDir,
+    '--ts',
+    '--app',
+    '--src-dir',
+    '--eslint',
+    '--no-tailwind',
+    '--import-alias',
+    '@/*',
+    packageFlag,
+    '--skip-install',
+    '--no-git',
+    '--yes',
+  ];
 
-  console.log(chalk.gray(`> ${getPackageManagerCommand(packageManager, 'install')}`));
-  await runShellCommand(getPackageManagerCommand(packageManager, 'install'), frontendDir);
+  console.log(chalk.gray(`> ${scaffoldArgv.join(' ')}`));
+  await runShellCommand(scaffoldArgv, targetDirectory);
 
-  await customizeNextJs(frontendDir, projectName, envFileName);
+  await customizeNextJs(frontendDir, projectName, definition.envFileName);
 }
 
 async function customizeNextJs(frontendDir: string, projectName: string, envFileName: string) {
-  const safeProjectName = escapeBackticks(projectName);
+  const projectNameLiteral = JSON.stringify(projectName);
   const appDir = path.join(frontendDir, 'src', 'app');
+  const libDir = path.join(frontendDir, 'src', 'lib');
+
+  await Promise.all([
+    mkdir(libDir, { recursive: true }).then(() => writeFile(path.join(libDir, 'api.ts'), NEXT_API_TS_BUFFER)),
+    writeNewFile(path.join(frontendDir, envFileName), NEXT_ENV_BUFFER),
+    writeFile(
+      path.join(appDir, 'layout.tsx'),
+      NEXT_LAYOUT_TSX.replaceAll(PROJECT_NAME_PLACEHOLDER, () => projectNameLiteral)
+    ),
+    writeFile(path.join(appDir, 'page.tsx'), NEXT_PAGE_TSX.replaceAll(PROJECT_NAME_PLACEHOLDER, () => projectNameLiteral)),
+    writeFile(path.join(appDir, 'globals.css'), NEXT_GLOBALS_CSS_BUFFER),
+  ]);
+}
 
-  await fs.ensureDir(path.join(frontendDir, 'src', 'lib'));
-
-  await fs.writeFile(path.join(frontendDir, envFileName), 'NEXT_PUBLIC_API_URL=http://localhost:3333\n');
-
-  const apiLines = [
-    "const API_BASE_URL = (process.env.NEXT_PUBLIC_API_URL ?? 'http://localhost:3333').replace(/\\/$/, '');",
-    '',
-    'export interface StatusSnapshot {',
-    "  status?: string;",
-    "  features?: Array<{ key?: string; name?: string; summary?: string }>;",
-    "  dependencies?: Array<{ name?: string; status?: string; details?: string }>;",
-    "  dataProviders?: Array<{ key?: string; status?: string; details?: string }>;",
-    '}',
-    '',
-    'export async function fetchStatus(): Promise<StatusSnapshot> {',
-    "  const response = await fetch(API_BASE_URL + '/status', { cache: 'no-store' });",
-    '',
-    '  if (!response.ok) {',
-    "    throw new Error(\"Impossible de contacter l'API (statut \" + response.status + \")\");",
-    '  }',
-    '',
-    '  return (await response.json()) as StatusSnapshot;',
-    '}',
-  ];
-  await fs.writeFile(path.join(frontendDir, 'src', 'lib', 'api.ts'), apiLines.join('\n') + '\n');
-
-  const layoutLines = [
-    "import type { Metadata } from 'next';",
-    "import './globals.css';",
-    '',
-    'export const metadata: Metadata = {',
-    f"  title: '{safeProjectName} é Console API',",
-    "  description: \"Interface front générée avec create-template-api pour consommer l'API.\",",
-    '};',
-    '',
-    'export default function RootLayout({ children }: { children: React.ReactNode }) {',
-    '  return (',
-    '    <html lang="fr">',
-    '      <body>{children}</body>',
-    '    </html>',
-    '  );',
-    '}',
-  ];
-  await fs.writeFile(path.join(appDir, 'layout.tsx'), layoutLines.join('\n') + '\n');
-
-  const pageLines = [
-    "import { fetchStatus } from '../lib/api';",
-    '',
-    'export default async function Home() {',
-    '  const status = await fetchStatus();',
-    '',
-    '  return (',
-    '    <main className="layout">',
-    f"      <h1>{safeProjectName} é Console API</h1>",
-    "      <p>Cette page interroge <code>GET /status</code> du backend cété serveur.</p>",
-    '      <pre>{JSON.stringify(status, null, 2)}</pre>',
-    '    </main>',
-    '  );',
-    '}',
-  ];
-  await fs.writeFile(path.join(appDir, 'page.tsx'), pageLines.join('\n') + '\n');
-
-  const cssLines = [
-    ':root {',
-    '  color-scheme: dark;',
-    '  background-color: #0f172a;',
-    '  color: #e2e8f0;',
-    "  font-family: 'Inter', system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;",
-    '}',
-    '',
-    'body {',
-    '  margin: 0;',
-    '}',
-    '',
-    '.layout {',
-    '  min-height: 100vh;',
-    '  padding: 2.5rem clamp(1.5rem, 4vw, 4rem);',
-    '  display: flex;',
-    '  flex-direction: column;',
-    '  gap: 1.5rem;',
-    '}',
-    '',
-    '.layout pre {',
-    '  margin: 0;',
-    '  background: rgba(15, 23, 42, 0.75);',
-    '  border: 1px solid rgba(148, 163, 184, 0.25);',
-    '  border-radius: 1rem;',
-    '  padding: 1.25rem;',
-    '  overflow: auto;',
-    '}',
-    '',
-    '.layout code {',
-    '  background: rgba(148, 163, 184, 0.25);',
-    '  padding: 0.1rem 0.4rem;',
-    '  border-radius: 0.4rem;',
-    '}',
-  ];
-  await fs.writeFile(path.join(appDir, 'globals.css'), cssLines.join('\n') + '\n');
+function formatError(error: unknown): string {
+  return error instanceof Error ? error.message : String(error);
+}
+
+function formatInstructionBlock(title: string, lines: string[]): string {
+  return `\\n${chalk.bold(title)}\\n` + chalk.cyan(lines.map((line) => `  ${line}`).join('\\n'));
 }
 
 export async function runCreateCommand(directoryArg: string | undefined, options: CreateCommandOptions) {
   const answers = await promptForMissingOptions({ ...options, targetDirectory: directoryArg ?? options.targetDirectory });
 
   const targetDirectory = path.resolve(process.cwd(), answers.targetDirectory);
+  const dryRun = options.dryRun ?? false;
 
-  ensureSafeProjectDirectory(targetDirectory);
+  if (dryRun) {
+    if (fs.statSync(targetDirectory, { throwIfNoEntry: false })?.isDirectory() === false) {
+      throw new Error(`${targetDirectory} existe déjà et n\\'est pas un dossier.`);
+    }
+  } else {
+    ensureSafeProjectDirectory(targetDirectory);
+  }
 
   const generator = getGeneratorForLanguage(answers.language as Language);
 
@@ -428,7 +550,7 @@ export async function runCreateCommand(directoryArg: string | undefined, options
     packageManager: answers.packageManager,
     dataProviders: answers.dataProviders,
     frontendFramework: answers.frontendFramework,
-    dryRun: options.dryRun ?? false,
+    dryRun,
   });
 
   const frontendResult = await scaffoldFrontend({
@@ -436,48 +558,49 @@ export async function runCreateCommand(directoryArg: string | undefined, options
     packageManager: answers.packageManager,
     targetDirectory,
     projectName: answers.projectName,
-    dryRun: options.dryRun ?? false,
+    dryRun,
   });
 
   const relativePath = path.relative(process.cwd(), targetDirectory) || '.';
 
-  let instructions = (
-    f"\n{chalk.bold('Prochaines étapes :')}\n"
-    + f"  {chalk.cyan(f'cd {relativePath}')}\n"
-    + f"  {chalk.cyan(getPackageManagerCommand(answers.packageManager, 'install'))}\n"
-    + f"  {chalk.cyan(getPackageManagerCommand(answers.packageManager, 'test'))} (optionnel)\n"
-    + f"  {chalk.cyan(getPackageManagerCommand(answers.packageManager, 'dev'))}\n"
-    + f"  {chalk.cyan(getPackageManagerCommand(answers.packageManager, 'apiStatus'))} (optionnel)"
-  );
+  let instructions = formatInstructionBlock('Prochaines étapes :', [
+    `cd ${relativePath}`,
+    getPackageManagerCommand(answers.packageManager, 'install'),
+    `${getPackageManagerCommand(answers.packageManager, 'test')} (optionnel)`,
+    getPackageManagerCommand(answers.packageManager, 'dev'),
+    `${getPackageManagerCommand(answers.packageManager, 'apiStatus')} (optionnel)`,
+  ]);
+
+  instructions += formatInstructionBlock('Configuration dynamique :', [
+    'config/providers.json (choisissez vos adapters)',
+    'config/feature-flags.json (activez/désactivez les modules)',
+  ]);
 
   if (frontendResult) {
-    const definition = frontendFrameworkCatalogMap.get(frontendResult.framework)!;
-    const frontendPathFromRoot = (
-      relativePath == '.'
-      and definition.appDirectory
-      or toPosixPath(path.join(relativePath, definition.appDirectory))
-    );
+    const { definition } = frontendResult;
 
-    instructions += (
-      f"\n{chalk.bold('Interface :')}\n"
-      + f"  {chalk.cyan(f'cd {frontendPathFromRoot}')} (optionnel)\n"
-      + f"  {chalk.cyan(getPackageManagerRunCommand(answers.packageManager, 'web:dev'))} (serveur front)\n"
-      + f"  {chalk.cyan(getPackageManagerRunCommand(answers.packageManager, 'web:build'))} (build front)"
-    );
+    instructions += formatInstructionBlock('Interface :', [
+      `${getPackageManagerRunCommand(answers.packageManager, 'web:install')} (dépendances front dans ${definition.appDirectory})`,
+      `${getPackageManagerRunCommand(answers.packageManager, 'web:dev')} (serveur front)`,
+      `${getPackageManagerRunCommand(answers.packageManager, 'web:build')} (build front)`,
+    ]);
   }
 
-  console.log('\n' + chalk.green('[OK] Template API généré avec succés !'));
+  console.log('\\n' + chalk.green('[OK] Template API générée avec succès !'));
   console.log(instructions);
 
-  if (options.dryRun) {
+  if (dryRun) {
     return;
   }
 
+  const { default: inquirer } = await import('inquirer');
   const { shouldRunTests } = await inquirer.prompt([
     {
       type: 'confirm',
       name: 'shouldRunTests',
-      message: 'Souhaitez-vous installer les dépendances et lancer la suite de tests maintenant ?',
+      message: frontendResult
+        ? 'Souhaitez-vous installer les dépendances (API et front) et lancer la suite de tests maintenant ?'
+        : 'Souhaitez-vous installer les dépendances et lancer la suite de tests maintenant ?',
       default: true,
     },
   ]);
@@ -486,27 +609,68 @@ export async function runCreateCommand(directoryArg: string | undefined, options
     return;
   }
 
-  const installCommand = getPackageManagerCommand(answers.packageManager, 'install');
-  const testCommand = getPackageManagerCommand(answers.packageManager, 'test');
+  const packageManager = answers.packageManager;
+  const quiet = !process.stdout.isTTY;
+  const apiTask = installAndTestApi(packageManager, targetDirectory, { quiet });
+  let frontendTask: Promise<void> = Promise.resolve();
 
-  try {
-    console.log('\n' + chalk.cyan(f"Installation des dépendances ({installCommand})..."));
-    await runShellCommand(installCommand, targetDirectory);
+  if (frontendResult) {
+    const installCommand = getPackageManagerCommand(packageManager, 'install');
+    // yarn classic has no cache lock between concurrent runs, so its installs stay sequential.
+    const runConcurrently = packageManager !== 'yarn';
+    const installFrontend = () => {
+      console.log('\\n' + chalk.cyan(`Installation des dépendances du front (${installCommand})...`));
+      // Next to the API run, only stderr is shown so the two outputs do not interleave.
+      return runShellCommand(getPackageManagerArgv(packageManager, 'install'), frontendResult.directory, {
+        quiet: runConcurrently || quiet,
+      });
+    };
+
+    frontendTask = runConcurrently ? installFrontend() : apiTask.catch(() => undefined).then(installFrontend);
+  }
 
-    console.log('\n' + chalk.cyan(f"Exécution des tests ({testCommand})..."));
-    await runShellCommand(testCommand, targetDirectory);
+  const [apiOutcome, frontendOutcome] = await Promise.allSettled([apiTask, frontendTask]);
 
-    console.log('\n' + chalk.green('[OK] Tests exécutés avec succés.'));
-  } catch (error) {
-    const message = error instanceof Error ? error.message : str(error);
-    console.error('\n' + chalk.red(f"[ERREUR] Les tests n'ont pas pu étre exécutés automatiquement : {message}"));
+  if (apiOutcome.status === 'fulfilled') {
+    console.log('\\n' + chalk.green('[OK] Tests exécutés avec succès.'));
+  } else {
+    console.error(
+      '\\n' +
+        chalk.red(`[ERREUR] Les tests n\\'ont pas pu être exécutés automatiquement : ${formatError(apiOutcome.reason)}`)
+    );
+  }
+
+  if (frontendResult) {
+    if (frontendOutcome.status === 'fulfilled') {
+      console.log(chalk.green('[OK] Dépendances du front installées.'));
+    } else {
+      console.error(
+        chalk.red(`[ERREUR] Les dépendances du front n\\'ont pas pu être installées : ${formatError(frontendOutcome.reason)}`)
+      );
+    }
+  }
+
+  if (apiOutcome.status === 'rejected' || frontendOutcome.status === 'rejected') {
     console.error(
       chalk.yellow(
-        'Vous pouvez relancer manuellement les commandes indiquées dans les étapes ci-dessus une fois prét.'
+        'Vous pouvez relancer manuellement les commandes indiquées dans les étapes ci-dessus une fois prêt.'
       )
     );
   }
 }
+
 """
 
-Path('src/cli/commands/create.ts').write_text(content, encoding='utf-8')
+_CONTENT_BYTES = content.encode('utf-8')
+
+
+def _write_if_changed(target: Path, data: bytes) -> None:
+    try:
+        if target.stat().st_size == len(data) and target.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    target.write_bytes(data)
+
+
+_write_if_changed(Path('src/cli/commands/create.ts'), _CONTENT_BYTES)
@@ -123,6 +123,15 @@ export abstract class BaseTemplateGenerator {
         return `yarn --cwd ${selectedFrontendDefinition.appDirectory} ${script}`;
       };
 
+      const frontendInstallScript =
+        packageManager === 'npm'
+          ? `npm install --prefix ${selectedFrontendDefinition.appDirectory}`
+          : packageManager === 'pnpm'
+            ? `pnpm --dir ${selectedFrontendDefinition.appDirectory} install`
+            : `yarn --cwd ${selectedFrontendDefinition.appDirectory} install`;
+
+      dependencies.scripts['web:install'] = frontendInstallScript;
+
       if (frontendFramework === 'react-vite') {
         dependencies.scripts['web:dev'] = buildFrontendScript('dev');
         dependencies.scripts['web:build'] = buildFrontendScript('build');
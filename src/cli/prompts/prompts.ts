@@ -1,4 +1,4 @@
-import inquirer from 'inquirer';
+import type inquirer from 'inquirer';
 import path from 'node:path';
 import {
   DataProviderKey,
@@ -151,7 +151,8 @@ export async function promptForMissingOptions(options: PromptOptions): Promise<P
     });
   }
 
-  const answers = await inquirer.prompt(questions);
+  const answers: inquirer.Answers =
+    questions.length > 0 ? await (await import('inquirer')).default.prompt(questions) : {};
 
   const rawProjectName = (options.projectName ?? answers.projectName ?? '').toString().trim();
   const projectName = rawProjectName || 'mon-api';